@@ -3,9 +3,12 @@ Streamlit Application for AI Hallucination Detection System
 Dark UI – Text only – Full results visible
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import requests
-from typing import Dict, Optional
+from typing import Dict
 
 # -------------------------------------------------
 # Page config
@@ -18,134 +21,50 @@ st.set_page_config(
 )
 
 # -------------------------------------------------
-# Hide Streamlit defaults
+# Dark UI CSS (hide Streamlit defaults + theme)
 # -------------------------------------------------
-st.markdown("""
-<style>
-#MainMenu {visibility: hidden;}
-footer {visibility: hidden;}
-header {visibility: hidden;}
-[data-testid="stSidebar"] {display: none;}
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def _load_css() -> str:
+    """Read the stylesheet once; reruns hit the cache"""
+    with open("assets/style.css") as f:
+        return f.read()
 
-# -------------------------------------------------
-# Dark UI CSS
-# -------------------------------------------------
-st.markdown("""
-<style>
-body {
-    background: radial-gradient(circle at top, #0f172a, #020617);
-}
-
-.container {
-    max-width: 1100px;
-    margin: auto;
-    padding: 3rem 1rem;
-}
-
-.badge {
-    display: inline-block;
-    padding: 6px 16px;
-    border-radius: 999px;
-    background: rgba(45,212,191,0.15);
-    color: #2dd4bf;
-    font-weight: 600;
-    margin-bottom: 1.5rem;
-}
-
-h1 {
-    font-size: 3rem;
-    font-weight: 800;
-    color: white;
-}
-
-h1 span {
-    color: #2dd4bf;
-}
-
-.subtitle {
-    color: #94a3b8;
-    font-size: 1.1rem;
-    margin-top: 1rem;
-    max-width: 750px;
-}
-
-.card {
-    background: #020617;
-    border: 1px solid #1e293b;
-    border-radius: 16px;
-    padding: 1.5rem;
-    margin-top: 1.5rem;
-}
-
-.section-title {
-    color: white;
-    font-weight: 600;
-    margin-bottom: 1rem;
-}
-
-.stat-card {
-    background: #020617;
-    border: 1px solid #1e293b;
-    border-radius: 12px;
-    padding: 1rem;
-    text-align: center;
-}
-
-.stat-value {
-    font-size: 2rem;
-    font-weight: 700;
-    color: #2dd4bf;
-}
-
-.stat-label {
-    color: #94a3b8;
-    font-size: 0.9rem;
-}
-
-.issue {
-    border-left: 4px solid;
-    padding: 1rem;
-    border-radius: 8px;
-    margin-bottom: 1rem;
-}
-
-.issue.high { border-color: #ef4444; background: rgba(239,68,68,0.08); }
-.issue.medium { border-color: #facc15; background: rgba(250,204,21,0.08); }
-.issue.low { border-color: #22c55e; background: rgba(34,197,94,0.08); }
-
-.verify-btn button {
-    background: #2dd4bf !important;
-    color: #020617 !important;
-    font-weight: 700;
-    border-radius: 12px !important;
-    height: 48px;
-}
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # -------------------------------------------------
 # API
 # -------------------------------------------------
 API_URL = "http://localhost:8000"
 
-def verify_text(text: str) -> Optional[Dict]:
-    try:
-        response = requests.post(
-            f"{API_URL}/verify",
-            json={
-                "text": text,
-                "verify_citations": True,
-                "verify_facts": True
-            },
-            timeout=120
-        )
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        st.error(f"API Error: {e}")
-        return None
+@st.cache_resource
+def _get_session() -> requests.Session:
+    """One pooled HTTP session shared across reruns"""
+    return requests.Session()
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Worker pool so the long verification POST never blocks the UI"""
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def verify_text(text: str) -> Dict:
+    """POST the text to the API
+
+    Failures raise instead of returning None: st.cache_data doesn't
+    record raising calls, so only successful responses are cached and a
+    transient API error is retried on the next click.
+    """
+    response = _get_session().post(
+        f"{API_URL}/verify",
+        json={
+            "text": text,
+            "verify_citations": True,
+            "verify_facts": True
+        },
+        timeout=120
+    )
+    response.raise_for_status()
+    return response.json()
 
 # -------------------------------------------------
 # UI
@@ -177,9 +96,25 @@ if st.button("Verify Content", use_container_width=True):
     if not text_input.strip():
         st.warning("Please enter some text to verify.")
     else:
-        with st.spinner("Analyzing text, verifying claims and citations..."):
-            result = verify_text(text_input)
-            st.session_state["result"] = result
+        # Run verification in a worker thread; the rerun loop below
+        # polls it so the tab stays responsive for the whole duration
+        st.session_state["pending"] = _get_executor().submit(verify_text, text_input)
+
+if "pending" in st.session_state:
+    future = st.session_state["pending"]
+    if future.done():
+        del st.session_state["pending"]
+        # result() re-raises any worker exception here on the main
+        # thread, where st.error actually has a ScriptRunContext
+        try:
+            st.session_state["result"] = future.result()
+        except Exception as e:
+            st.session_state.pop("result", None)
+            st.error(f"API Error: {e}")
+    else:
+        with st.status("Analyzing text, verifying claims and citations...", expanded=False):
+            time.sleep(0.5)
+        st.rerun()
 
 st.markdown('</div>', unsafe_allow_html=True)
 
@@ -2,12 +2,18 @@
 Citation Verification Module
 Verifies if citations exist, are accessible, and match the claims
 """
-import requests
+import asyncio
+import httpx
+import orjson
 import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from extractors import Citation
-import time
 
 from config import (
     CROSSREF_API_URL,
@@ -17,7 +23,59 @@ from config import (
 )
 
 
-@dataclass
+# Compiled once; used on every relevance calculation
+_WORD_RE = re.compile(r'\b\w+\b')
+_WORD4_RE = re.compile(r'\b\w{4,}\b')
+
+# Well-formed DOIs start with a "10." prefix and a registrant code
+_DOI_RE = re.compile(r'^10\.\d{4,9}/\S+$')
+
+# Canonical interned status strings; the scorer tallies these with dict
+# lookups and identity checks, so every result must carry these exact
+# objects rather than fresh equal strings
+VERIFIED = sys.intern("verified")
+FAKE = sys.intern("fake")
+IRRELEVANT = sys.intern("irrelevant")
+UNKNOWN = sys.intern("unknown")
+
+
+def default_headers() -> Dict[str, str]:
+    """Headers shared by the sync and async HTTP clients"""
+    headers = {'User-Agent': 'AI-Hallucination-Checker/1.0'}
+    if SEMANTIC_SCHOLAR_API_KEY:
+        headers['x-api-key'] = SEMANTIC_SCHOLAR_API_KEY
+    return headers
+
+
+class RequestRateLimiter:
+    """Sliding-window rate limiter: at most `rpm` requests per minute
+
+    Unlike a fixed inter-request delay, this only blocks when the window
+    is actually full, so slow responses don't add idle time on top.
+    """
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self._timestamps = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Block until a request may be sent within the rate limit"""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] > 60.0:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.rpm:
+                    self._timestamps.append(time.monotonic())
+                    return
+                wait = 60.0 - (now - self._timestamps[0])
+            # Sleep with the lock released so other waiters can make
+            # progress as the window slides
+            await asyncio.sleep(wait)
+
+
+@dataclass(slots=True, frozen=True)
 class CitationVerificationResult:
     """Result of citation verification"""
     citation: Citation
@@ -33,10 +91,42 @@ class CitationVerifier:
     """Verifies citations using multiple academic databases"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'AI-Hallucination-Checker/1.0'
-        })
+        # HTTP/2 client: many in-flight lookups against api.crossref.org /
+        # api.semanticscholar.org multiplex over a single TLS connection,
+        # and the transport retries transient connection failures
+        # http2/limits must live on the transport: httpx ignores both
+        # client kwargs when an explicit transport= is passed. retries=
+        # only re-attempts connect errors; transient 429/5xx responses
+        # are handled by leaving them out of the lookup caches so the
+        # next call retries them
+        self.client = httpx.Client(
+            timeout=10.0,
+            headers=default_headers(),
+            transport=httpx.HTTPTransport(
+                retries=3,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=50, max_keepalive_connections=50
+                )
+            )
+        )
+        # In-process memoization - the same DOI / author-year pair often
+        # appears multiple times within one document and across documents.
+        # The cached inners raise on transport errors and throttling
+        # statuses; lru_cache doesn't record raising calls, so only
+        # definitive answers ("found" / "API says not found") stick and
+        # transient failures are retried on the next lookup
+        self._claim_keywords = lru_cache(maxsize=1024)(self._claim_keywords)
+        self._fetch_crossref_doi_cached = (
+            lru_cache(maxsize=4096)(self._fetch_crossref_doi_cached)
+        )
+        self._fetch_s2_search_cached = (
+            lru_cache(maxsize=4096)(self._fetch_s2_search_cached)
+        )
+        self._fetch_crossref_search_cached = (
+            lru_cache(maxsize=4096)(self._fetch_crossref_search_cached)
+        )
+        self._async_cache: Dict = {}  # Same idea for the async lookup path
     
     def verify_citation(self, citation: Citation, claim_text: str = "") -> CitationVerificationResult:
         """Verify a single citation"""
@@ -55,70 +145,186 @@ class CitationVerifier:
                 exists=False,
                 accessible=False,
                 relevance_score=0.0,
-                verification_status="unknown",
+                verification_status=UNKNOWN,
                 details={"error": "Unknown citation type"}
             )
     
+    def _fetch_crossref_doi_cached(self, doi: str) -> Optional[Dict]:
+        """Fetch a paper record for a DOI from CrossRef (memoized)
+
+        Raises on transient failures so they are never cached.
+        """
+        response = self.client.get(
+            f"{CROSSREF_API_URL}/{doi}",
+            timeout=10
+        )
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            if data.get("status") == "ok":
+                return data.get("message", {})
+            return None
+        if response.status_code == 404:
+            # CrossRef says the DOI doesn't exist - a real verdict
+            return None
+        response.raise_for_status()
+        return None
+
+    def _fetch_crossref_doi(self, doi: str) -> Optional[Dict]:
+        try:
+            return self._fetch_crossref_doi_cached(doi)
+        except Exception as e:
+            return None
+
+    def _fetch_s2_search_cached(self, author: str, year: str) -> Tuple[Dict, ...]:
+        """Search Semantic Scholar by author and year (memoized)
+
+        Raises on transient failures so they are never cached.
+        """
+        params = {
+            "query": f"{author} {year}",
+            "limit": 5,
+            "fields": "title,authors,year,abstract,url"
+        }
+
+        response = self.client.get(
+            SEMANTIC_SCHOLAR_API_URL,
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return tuple(data.get("data", []))
+
+    def _fetch_s2_search(self, author: str, year: str) -> Tuple[Dict, ...]:
+        try:
+            return self._fetch_s2_search_cached(author, year)
+        except Exception as e:
+            return ()
+
+    def _fetch_crossref_search_cached(self, author: str, year: str) -> Tuple[Dict, ...]:
+        """Search CrossRef by author and year (memoized)
+
+        Raises on transient failures so they are never cached.
+        """
+        params = {"query": f"{author} {year}", "rows": 5}
+        response = self.client.get(
+            CROSSREF_API_URL,
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return tuple(data.get("message", {}).get("items", []))
+
+    def _fetch_crossref_search(self, author: str, year: str) -> Tuple[Dict, ...]:
+        try:
+            return self._fetch_crossref_search_cached(author, year)
+        except Exception as e:
+            return ()
+
+    async def _aprefetch_dois(self, dois: List[str], client: httpx.AsyncClient):
+        """Resolve many DOIs in one CrossRef filter query, priming the cache
+
+        After this runs, _averify_doi answers from the cache instead of
+        issuing one GET per DOI.
+        """
+        missing = [d for d in dois if ("doi", d) not in self._async_cache]
+        if not missing:
+            return
+
+        try:
+            params = {
+                "filter": ",".join(f"doi:{d}" for d in missing),
+                "rows": len(missing)
+            }
+            response = await client.get(CROSSREF_API_URL, params=params)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                items = data.get("message", {}).get("items", [])
+                by_doi = {item.get("DOI", "").lower(): item for item in items}
+                for d in missing:
+                    self._async_cache[("doi", d)] = by_doi.get(d.lower())
+        except Exception as e:
+            pass
+
     def _verify_doi(self, citation: Citation, claim_text: str) -> CitationVerificationResult:
         """Verify DOI citation"""
         doi = citation.doi or citation.text.replace("doi:", "").strip()
-        
+
+        # Don't waste a round-trip (and a rate-limit token) on strings
+        # that can't possibly be a DOI
+        if not _DOI_RE.match(doi):
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=FAKE,
+                details={"error": "Malformed DOI"}
+            )
+
         # Try CrossRef
-        try:
-            response = self.session.get(
-                f"{CROSSREF_API_URL}/{doi}",
-                timeout=10
+        paper = self._fetch_crossref_doi(doi)
+        if paper is not None:
+            relevance = self._calculate_relevance(paper, claim_text)
+
+            return CitationVerificationResult(
+                citation=citation,
+                exists=True,
+                accessible=True,
+                relevance_score=relevance,
+                verification_status=VERIFIED if relevance > 0.5 else IRRELEVANT,
+                details={"source": "crossref", "paper": paper},
+                matched_paper=paper
             )
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("status") == "ok":
-                    paper = data.get("message", {})
-                    relevance = self._calculate_relevance(paper, claim_text)
-                    
-                    return CitationVerificationResult(
-                        citation=citation,
-                        exists=True,
-                        accessible=True,
-                        relevance_score=relevance,
-                        verification_status="verified" if relevance > 0.5 else "irrelevant",
-                        details={"source": "crossref", "paper": paper},
-                        matched_paper=paper
-                    )
-        except Exception as e:
-            pass
-        
+
         return CitationVerificationResult(
             citation=citation,
             exists=False,
             accessible=False,
             relevance_score=0.0,
-            verification_status="fake",
+            verification_status=FAKE,
             details={"error": "DOI not found in CrossRef"}
         )
     
     def _verify_url(self, citation: Citation, claim_text: str) -> CitationVerificationResult:
         """Verify URL citation"""
         url = citation.url or citation.text
-        
+
+        # Skip anything that isn't an http(s) URL before going online
+        if not url.startswith(('http://', 'https://')):
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=FAKE,
+                details={"error": "Not an http(s) URL"}
+            )
+
         try:
-            response = self.session.head(url, timeout=10, allow_redirects=True)
-            accessible = response.status_code == 200
-            
+            # One ranged GET both checks accessibility and fetches the
+            # first bytes for the relevance check (some servers reject
+            # HEAD outright, so a separate probe would also misreport)
+            with self.client.stream(
+                "GET", url, headers={'Range': 'bytes=0-8191'}, follow_redirects=True
+            ) as response:
+                accessible = response.status_code in (200, 206)
+                chunk = next(response.iter_bytes(8192), b'') if accessible else b''
+
             if accessible:
-                # Try to get more info about the page
-                try:
-                    full_response = self.session.get(url, timeout=10)
-                    # Simple relevance check based on claim keywords
-                    relevance = self._simple_text_relevance(full_response.text[:1000], claim_text)
-                except:
-                    relevance = 0.5  # Default if we can't analyze content
-                
+                relevance = self._simple_text_relevance(
+                    chunk.decode('utf-8', errors='ignore'),
+                    claim_text
+                )
+
                 return CitationVerificationResult(
                     citation=citation,
                     exists=True,
                     accessible=True,
                     relevance_score=relevance,
-                    verification_status="verified" if relevance > 0.3 else "irrelevant",
+                    verification_status=VERIFIED if relevance > 0.3 else IRRELEVANT,
                     details={"status_code": response.status_code, "url": url}
                 )
             else:
@@ -127,7 +333,7 @@ class CitationVerifier:
                     exists=True,
                     accessible=False,
                     relevance_score=0.0,
-                    verification_status="fake",
+                    verification_status=FAKE,
                     details={"status_code": response.status_code, "error": "URL not accessible"}
                 )
         except Exception as e:
@@ -136,7 +342,7 @@ class CitationVerifier:
                 exists=False,
                 accessible=False,
                 relevance_score=0.0,
-                verification_status="fake",
+                verification_status=FAKE,
                 details={"error": str(e)}
             )
     
@@ -151,105 +357,82 @@ class CitationVerifier:
                 exists=False,
                 accessible=False,
                 relevance_score=0.0,
-                verification_status="unknown",
+                verification_status=UNKNOWN,
                 details={"error": "Missing author or year"}
             )
         
-        # Try Semantic Scholar API
-        try:
-            # Search by author and year
-            query = f"{authors[0]} {year}"
-            params = {
-                "query": query,
-                "limit": 5,
-                "fields": "title,authors,year,abstract,url"
-            }
-            
-            if SEMANTIC_SCHOLAR_API_KEY:
-                self.session.headers.update({
-                    'x-api-key': SEMANTIC_SCHOLAR_API_KEY
-                })
-            
-            response = self.session.get(
-                SEMANTIC_SCHOLAR_API_URL,
-                params=params,
-                timeout=10
+        # Tokenize the claim and lowercase the authors once; reused for
+        # every candidate paper below
+        claim_kw = self._claim_keywords(claim_text)
+        authors_lc = [a.lower() for a in authors]
+
+        # Fire Semantic Scholar and the CrossRef fallback concurrently;
+        # when Semantic Scholar misses we'd pay for CrossRef anyway, so
+        # this costs max(t1, t2) instead of t1 + t2
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            s2_future = executor.submit(self._fetch_s2_search, authors[0], year)
+            crossref_future = executor.submit(self._fetch_crossref_search, authors[0], year)
+            papers = s2_future.result()
+            items = crossref_future.result()
+
+        # Find best match
+        best_match = None
+        best_relevance = 0.0
+
+        for paper in papers:
+            # Check if year matches
+            if str(paper.get("year")) == str(year):
+                # Check if author matches
+                author_match = any(
+                    auth in pa
+                    for pa in (a.get("name", "").lower() for a in paper.get("authors", []))
+                    for auth in authors_lc
+                )
+
+                if author_match:
+                    relevance = self._score_paper(paper, claim_kw)
+                    if relevance > best_relevance:
+                        best_relevance = relevance
+                        best_match = paper
+                        if best_relevance > 0.8:
+                            # Comfortably above the 0.5 verification
+                            # threshold - the verdict can't change, so
+                            # skip scoring the remaining candidates
+                            break
+
+        if best_match:
+            return CitationVerificationResult(
+                citation=citation,
+                exists=True,
+                accessible=True,
+                relevance_score=best_relevance,
+                verification_status=VERIFIED if best_relevance > 0.5 else IRRELEVANT,
+                details={"source": "semantic_scholar", "paper": best_match},
+                matched_paper=best_match
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                papers = data.get("data", [])
-                
-                # Find best match
-                best_match = None
-                best_relevance = 0.0
-                
-                for paper in papers:
-                    # Check if year matches
-                    if str(paper.get("year")) == str(year):
-                        # Check if author matches
-                        paper_authors = [a.get("name", "") for a in paper.get("authors", [])]
-                        author_match = any(
-                            any(auth.lower() in pa.lower() for auth in authors)
-                            for pa in paper_authors
-                        )
-                        
-                        if author_match:
-                            relevance = self._calculate_relevance(paper, claim_text)
-                            if relevance > best_relevance:
-                                best_relevance = relevance
-                                best_match = paper
-                
-                if best_match:
+
+        # Fall back to the CrossRef results
+        for item in items:
+            item_year = item.get("published-print", {}).get("date-parts", [[None]])[0][0]
+            if str(item_year) == str(year):
+                relevance = self._score_paper(item, claim_kw)
+                if relevance > 0.3:
                     return CitationVerificationResult(
                         citation=citation,
                         exists=True,
                         accessible=True,
-                        relevance_score=best_relevance,
-                        verification_status="verified" if best_relevance > 0.5 else "irrelevant",
-                        details={"source": "semantic_scholar", "paper": best_match},
-                        matched_paper=best_match
+                        relevance_score=relevance,
+                        verification_status=VERIFIED if relevance > 0.5 else IRRELEVANT,
+                        details={"source": "crossref", "paper": item},
+                        matched_paper=item
                     )
-        except Exception as e:
-            pass
-        
-        # Try CrossRef as fallback
-        try:
-            query = f"{authors[0]} {year}"
-            params = {"query": query, "rows": 5}
-            response = self.session.get(
-                CROSSREF_API_URL,
-                params=params,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get("message", {}).get("items", [])
-                
-                for item in items:
-                    item_year = item.get("published-print", {}).get("date-parts", [[None]])[0][0]
-                    if str(item_year) == str(year):
-                        relevance = self._calculate_relevance(item, claim_text)
-                        if relevance > 0.3:
-                            return CitationVerificationResult(
-                                citation=citation,
-                                exists=True,
-                                accessible=True,
-                                relevance_score=relevance,
-                                verification_status="verified" if relevance > 0.5 else "irrelevant",
-                                details={"source": "crossref", "paper": item},
-                                matched_paper=item
-                            )
-        except Exception as e:
-            pass
-        
+
         return CitationVerificationResult(
             citation=citation,
             exists=False,
             accessible=False,
             relevance_score=0.0,
-            verification_status="fake",
+            verification_status=FAKE,
             details={"error": "Citation not found in academic databases"}
         )
     
@@ -262,73 +445,474 @@ class CitationVerifier:
             exists=False,
             accessible=False,
             relevance_score=0.0,
-            verification_status="unknown",
+            verification_status=UNKNOWN,
             details={"error": "IEEE citations require full reference list for verification"}
         )
     
-    def _calculate_relevance(self, paper: Dict, claim_text: str) -> float:
-        """Calculate how relevant a paper is to the claim"""
-        if not claim_text:
+    def _claim_keywords(self, claim_text: str) -> frozenset:
+        """Extract the keyword set for a claim (memoized)"""
+        return frozenset(_WORD_RE.findall(claim_text.lower()))
+
+    def _score_paper(self, paper: Dict, claim_kw: frozenset) -> float:
+        """Score a candidate paper against precomputed claim keywords"""
+        if not claim_kw:
             return 0.5
-        
-        # Extract keywords from claim
-        claim_words = set(re.findall(r'\b\w+\b', claim_text.lower()))
-        
+
         # Get paper text (title, abstract)
         paper_text = ""
         if isinstance(paper, dict):
             paper_text += paper.get("title", "").lower()
             paper_text += " " + paper.get("abstract", "").lower()
-        
+
         if not paper_text:
             return 0.3
-        
+
         # Simple keyword overlap
-        paper_words = set(re.findall(r'\b\w+\b', paper_text))
-        overlap = len(claim_words & paper_words)
-        total = len(claim_words)
-        
-        if total == 0:
-            return 0.5
-        
-        relevance = min(1.0, overlap / total)
+        paper_words = set(_WORD_RE.findall(paper_text))
+        overlap = len(claim_kw & paper_words)
+
+        relevance = min(1.0, overlap / len(claim_kw))
         return relevance
+
+    def _calculate_relevance(self, paper: Dict, claim_text: str) -> float:
+        """Calculate how relevant a paper is to the claim"""
+        if not claim_text:
+            return 0.5
+        return self._score_paper(paper, self._claim_keywords(claim_text))
     
     def _simple_text_relevance(self, text: str, claim_text: str) -> float:
         """Simple text-based relevance calculation"""
-        claim_words = set(re.findall(r'\b\w{4,}\b', claim_text.lower()))
-        text_words = set(re.findall(r'\b\w{4,}\b', text.lower()))
-        
+        claim_words = frozenset(_WORD4_RE.findall(claim_text.lower()))
+        text_words = set(_WORD4_RE.findall(text.lower()))
+
         if not claim_words:
             return 0.5
-        
+
         overlap = len(claim_words & text_words)
         return min(1.0, overlap / len(claim_words))
 
+    async def averify_citation(
+        self,
+        citation: Citation,
+        claim_text: str,
+        client: httpx.AsyncClient
+    ) -> CitationVerificationResult:
+        """Verify a single citation asynchronously using a shared HTTP client"""
+        if citation.citation_type == "doi":
+            return await self._averify_doi(citation, claim_text, client)
+        elif citation.citation_type == "url":
+            return await self._averify_url(citation, claim_text, client)
+        elif citation.citation_type in ["apa", "mla"]:
+            return await self._averify_author_year(citation, claim_text, client)
+        elif citation.citation_type == "ieee":
+            # No network needed - same local handling as the sync path
+            return self._verify_ieee(citation, claim_text)
+        else:
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=UNKNOWN,
+                details={"error": "Unknown citation type"}
+            )
+
+    async def _averify_doi(
+        self,
+        citation: Citation,
+        claim_text: str,
+        client: httpx.AsyncClient
+    ) -> CitationVerificationResult:
+        """Async DOI verification via CrossRef"""
+        doi = citation.doi or citation.text.replace("doi:", "").strip()
+
+        # Don't waste a round-trip (and a rate-limit token) on strings
+        # that can't possibly be a DOI
+        if not _DOI_RE.match(doi):
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=FAKE,
+                details={"error": "Malformed DOI"}
+            )
+
+        cache_key = ("doi", doi)
+        paper = self._async_cache.get(cache_key)
+        if paper is None and cache_key not in self._async_cache:
+            try:
+                response = await client.get(f"{CROSSREF_API_URL}/{doi}")
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    if data.get("status") == "ok":
+                        paper = data.get("message", {})
+                    self._async_cache[cache_key] = paper
+                elif response.status_code == 404:
+                    # A definitive "no such DOI" is worth remembering;
+                    # throttles and server errors are not, so the next
+                    # document retries them
+                    self._async_cache[cache_key] = None
+            except Exception as e:
+                pass
+
+        if paper is not None:
+            relevance = self._calculate_relevance(paper, claim_text)
+
+            return CitationVerificationResult(
+                citation=citation,
+                exists=True,
+                accessible=True,
+                relevance_score=relevance,
+                verification_status=VERIFIED if relevance > 0.5 else IRRELEVANT,
+                details={"source": "crossref", "paper": paper},
+                matched_paper=paper
+            )
+
+        return CitationVerificationResult(
+            citation=citation,
+            exists=False,
+            accessible=False,
+            relevance_score=0.0,
+            verification_status=FAKE,
+            details={"error": "DOI not found in CrossRef"}
+        )
+
+    async def _averify_url(
+        self,
+        citation: Citation,
+        claim_text: str,
+        client: httpx.AsyncClient
+    ) -> CitationVerificationResult:
+        """Async URL verification"""
+        url = citation.url or citation.text
+
+        # Skip anything that isn't an http(s) URL before going online
+        if not url.startswith(('http://', 'https://')):
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=FAKE,
+                details={"error": "Not an http(s) URL"}
+            )
+
+        try:
+            # One ranged GET both checks accessibility and fetches the
+            # first bytes for the relevance check (some servers reject
+            # HEAD outright, so a separate probe would also misreport)
+            chunk = b''
+            async with client.stream(
+                "GET", url, headers={'Range': 'bytes=0-8191'}, follow_redirects=True
+            ) as response:
+                accessible = response.status_code in (200, 206)
+                if accessible:
+                    async for part in response.aiter_bytes(8192):
+                        chunk = part
+                        break
+
+            if accessible:
+                relevance = self._simple_text_relevance(
+                    chunk.decode('utf-8', errors='ignore'),
+                    claim_text
+                )
+
+                return CitationVerificationResult(
+                    citation=citation,
+                    exists=True,
+                    accessible=True,
+                    relevance_score=relevance,
+                    verification_status=VERIFIED if relevance > 0.3 else IRRELEVANT,
+                    details={"status_code": response.status_code, "url": url}
+                )
+            else:
+                return CitationVerificationResult(
+                    citation=citation,
+                    exists=True,
+                    accessible=False,
+                    relevance_score=0.0,
+                    verification_status=FAKE,
+                    details={"status_code": response.status_code, "error": "URL not accessible"}
+                )
+        except Exception as e:
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=FAKE,
+                details={"error": str(e)}
+            )
+
+    async def _averify_author_year(
+        self,
+        citation: Citation,
+        claim_text: str,
+        client: httpx.AsyncClient
+    ) -> CitationVerificationResult:
+        """Async author-year verification (APA/MLA style)"""
+        authors = citation.authors or []
+        year = citation.year
+
+        if not authors or not year:
+            return CitationVerificationResult(
+                citation=citation,
+                exists=False,
+                accessible=False,
+                relevance_score=0.0,
+                verification_status=UNKNOWN,
+                details={"error": "Missing author or year"}
+            )
+
+        # Tokenize the claim and lowercase the authors once; reused for
+        # every candidate paper below
+        claim_kw = self._claim_keywords(claim_text)
+        authors_lc = [a.lower() for a in authors]
+
+        # Fire Semantic Scholar and the CrossRef fallback concurrently;
+        # when Semantic Scholar misses we'd pay for CrossRef anyway, so
+        # this costs max(t1, t2) instead of t1 + t2
+        papers, items = await asyncio.gather(
+            self._afetch_s2_search(authors[0], year, client),
+            self._afetch_crossref_search(authors[0], year, client)
+        )
+
+        # Find best match
+        best_match = None
+        best_relevance = 0.0
+
+        for paper in papers:
+            # Check if year matches
+            if str(paper.get("year")) == str(year):
+                # Check if author matches
+                author_match = any(
+                    auth in pa
+                    for pa in (a.get("name", "").lower() for a in paper.get("authors", []))
+                    for auth in authors_lc
+                )
+
+                if author_match:
+                    relevance = self._score_paper(paper, claim_kw)
+                    if relevance > best_relevance:
+                        best_relevance = relevance
+                        best_match = paper
+                        if best_relevance > 0.8:
+                            # Comfortably above the 0.5 verification
+                            # threshold - the verdict can't change, so
+                            # skip scoring the remaining candidates
+                            break
+
+        if best_match:
+            return CitationVerificationResult(
+                citation=citation,
+                exists=True,
+                accessible=True,
+                relevance_score=best_relevance,
+                verification_status=VERIFIED if best_relevance > 0.5 else IRRELEVANT,
+                details={"source": "semantic_scholar", "paper": best_match},
+                matched_paper=best_match
+            )
+
+        # Fall back to the CrossRef results
+        for item in items:
+            item_year = item.get("published-print", {}).get("date-parts", [[None]])[0][0]
+            if str(item_year) == str(year):
+                relevance = self._score_paper(item, claim_kw)
+                if relevance > 0.3:
+                    return CitationVerificationResult(
+                        citation=citation,
+                        exists=True,
+                        accessible=True,
+                        relevance_score=relevance,
+                        verification_status=VERIFIED if relevance > 0.5 else IRRELEVANT,
+                        details={"source": "crossref", "paper": item},
+                        matched_paper=item
+                    )
+
+        return CitationVerificationResult(
+            citation=citation,
+            exists=False,
+            accessible=False,
+            relevance_score=0.0,
+            verification_status=FAKE,
+            details={"error": "Citation not found in academic databases"}
+        )
+
+    async def _afetch_s2_search(
+        self,
+        author: str,
+        year: str,
+        client: httpx.AsyncClient
+    ) -> List[Dict]:
+        """Async Semantic Scholar search by author and year (cached)"""
+        cache_key = ("s2_search", author, year)
+        if cache_key in self._async_cache:
+            return self._async_cache[cache_key]
+
+        papers = []
+        try:
+            params = {
+                "query": f"{author} {year}",
+                "limit": 5,
+                "fields": "title,authors,year,abstract,url"
+            }
+
+            response = await client.get(
+                SEMANTIC_SCHOLAR_API_URL,
+                params=params
+            )
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                papers = data.get("data", [])
+                # Only successful lookups are cached; a timeout or 429
+                # here must not pin this author/year to "no results"
+                self._async_cache[cache_key] = papers
+        except Exception as e:
+            pass
+
+        return papers
+
+    async def _afetch_crossref_search(
+        self,
+        author: str,
+        year: str,
+        client: httpx.AsyncClient
+    ) -> List[Dict]:
+        """Async CrossRef search by author and year (cached)"""
+        cache_key = ("crossref_search", author, year)
+        if cache_key in self._async_cache:
+            return self._async_cache[cache_key]
+
+        items = []
+        try:
+            params = {"query": f"{author} {year}", "rows": 5}
+            response = await client.get(CROSSREF_API_URL, params=params)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                items = data.get("message", {}).get("items", [])
+                # Only successful lookups are cached (see _afetch_s2_search)
+                self._async_cache[cache_key] = items
+        except Exception as e:
+            pass
+
+        return items
+
 
 class BatchCitationVerifier:
-    """Verifies multiple citations with rate limiting"""
-    
+    """Verifies multiple citations concurrently with bounded parallelism"""
+
     def __init__(self):
         self.verifier = CitationVerifier()
-        self.delay = 0.5  # Delay between requests to respect rate limits
-    
-    def verify_citations(
-        self, 
-        citations: List[Citation], 
+        self.max_concurrency = 10  # Concurrent requests allowed in flight
+        self.requests_per_minute = 100  # Per-host budget
+        # Keyed by (event loop, host): the sync entry point runs every
+        # batch under a fresh asyncio.run(), and an asyncio.Lock that
+        # waited on an earlier loop raises "bound to a different event
+        # loop" if reused on the next one
+        self._rate_limiters: Dict[tuple, RequestRateLimiter] = {}
+
+    async def _throttle(self, request: httpx.Request):
+        """httpx request hook applying a per-host sliding-window limit"""
+        loop_id = id(asyncio.get_running_loop())
+        key = (loop_id, request.url.host)
+        limiter = self._rate_limiters.get(key)
+        if limiter is None:
+            # Drop limiters left behind by finished loops so the dict
+            # doesn't grow across repeated sync batches
+            self._rate_limiters = {
+                k: v for k, v in self._rate_limiters.items() if k[0] == loop_id
+            }
+            limiter = self._rate_limiters[key] = RequestRateLimiter(
+                self.requests_per_minute
+            )
+        await limiter.acquire()
+
+    @staticmethod
+    def _dedupe_key(citation: Citation, claim_texts: Dict[str, str]) -> tuple:
+        """Canonical key for a citation
+
+        Two citations with the same key (and the same associated claim, so
+        relevance scores stay correct) resolve to the same lookup.
+        """
+        identity = (
+            citation.doi
+            or citation.url
+            or (tuple(citation.authors or ()), citation.year, citation.text)
+        )
+        return (citation.citation_type, identity, claim_texts.get(citation.text, ""))
+
+    async def verify_citations_async(
+        self,
+        citations: List[Citation],
         claim_texts: Dict[str, str] = None
     ) -> List[CitationVerificationResult]:
-        """Verify multiple citations"""
-        results = []
+        """Verify multiple citations concurrently"""
         claim_texts = claim_texts or {}
-        
-        for citation in citations:
-            claim_text = claim_texts.get(citation.text, "")
-            result = self.verifier.verify_citation(citation, claim_text)
+
+        # Tokenize every unique claim for this document in one pre-pass;
+        # all downstream paper scoring then hits the keyword cache, no
+        # matter how many candidate papers a claim is compared against
+        for text in set(claim_texts.values()):
+            self.verifier._claim_keywords(text)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=limits,
+            headers=default_headers(),
+            event_hooks={'request': [self._throttle]}
+        ) as client:
+            # One filter query for all DOIs instead of N individual GETs
+            dois = sorted({
+                c.doi or c.text.replace("doi:", "").strip()
+                for c in citations
+                if c.citation_type == "doi"
+            })
+            if dois:
+                await self.verifier._aprefetch_dois(dois, client)
+
+            async def verify_one(citation: Citation) -> CitationVerificationResult:
+                async with semaphore:
+                    return await self.verifier.averify_citation(
+                        citation,
+                        claim_texts.get(citation.text, ""),
+                        client
+                    )
+
+            # Verify each unique citation once, then fan results back out
+            unique: Dict[tuple, Citation] = {}
+            for c in citations:
+                unique.setdefault(self._dedupe_key(c, claim_texts), c)
+
+            verified = await asyncio.gather(
+                *[verify_one(c) for c in unique.values()]
+            )
+            by_key = dict(zip(unique.keys(), verified))
+
+        results = []
+        for c in citations:
+            result = by_key[self._dedupe_key(c, claim_texts)]
+            if result.citation is not c:
+                # Duplicate occurrence - reuse the verdict, keep this
+                # occurrence's positions
+                result = replace(result, citation=c)
             results.append(result)
-            time.sleep(self.delay)  # Rate limiting
-        
+
         return results
 
+    def verify_citations(
+        self,
+        citations: List[Citation],
+        claim_texts: Dict[str, str] = None
+    ) -> List[CitationVerificationResult]:
+        """Verify multiple citations (synchronous entry point)"""
+        return asyncio.run(self.verify_citations_async(citations, claim_texts))
+
 
 
@@ -2,6 +2,7 @@
 Configuration settings for the AI Hallucination Detection System
 """
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -32,14 +33,27 @@ RISK_THRESHOLDS = {
     "high": 100
 }
 
-# Citation Patterns (Regex)
+# Citation Patterns (compiled once at import; also surfaces bad regexes
+# at startup instead of on first use)
 CITATION_PATTERNS = {
-    "apa": r"([A-Z][a-z]+(?:\s+et\s+al\.)?(?:\s+and\s+[A-Z][a-z]+)?)\s*\((\d{4})\)",
-    "mla": r"([A-Z][a-z]+(?:\s+et\s+al\.)?)\s+(\d{4})",
-    "ieee": r"\[(\d+)\]",
-    "url": r"https?://[^\s\)]+",
-    "doi": r"doi:([^\s\)]+)",
+    "apa": re.compile(r"([A-Z][a-z]+(?:\s+et\s+al\.)?(?:\s+and\s+[A-Z][a-z]+)?)\s*\((\d{4})\)", re.IGNORECASE),
+    "mla": re.compile(r"([A-Z][a-z]+(?:\s+et\s+al\.)?)\s+(\d{4})", re.IGNORECASE),
+    "ieee": re.compile(r"\[(\d+)\]"),
+    "url": re.compile(r"https?://[^\s\)]+"),
+    "doi": re.compile(r"doi:([^\s\)]+)", re.IGNORECASE),
 }
 
+# All styles fused into one alternation so extraction scans the text
+# once instead of once per style. Inner groups are named because
+# match.lastgroup is unreliable when a named group contains captures.
+CITATION_PATTERN_COMBINED = re.compile(
+    r"(?P<apa>(?P<apa_author>[A-Z][a-z]+(?:\s+et\s+al\.)?(?:\s+and\s+[A-Z][a-z]+)?)\s*\((?P<apa_year>\d{4})\))"
+    r"|(?P<mla>(?P<mla_author>[A-Z][a-z]+(?:\s+et\s+al\.)?)\s+(?P<mla_year>\d{4}))"
+    r"|(?P<ieee>\[(?P<ieee_ref>\d+)\])"
+    r"|(?P<url>https?://[^\s\)]+)"
+    r"|(?P<doi>doi:(?P<doi_id>[^\s\)]+))",
+    re.IGNORECASE
+)
+
 
 
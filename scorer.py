@@ -2,25 +2,93 @@
 Hallucination Scoring and Risk Assessment Module
 Computes overall hallucination risk scores and generates user-friendly reports
 """
-from typing import Dict, List
+import sys
+from collections import Counter
+from typing import Dict, List, Tuple
 from dataclasses import dataclass, asdict
+import numpy as np
 from extractors import Claim, Citation
-from citation_verifier import CitationVerificationResult
-from fact_verifier import FactVerificationResult
+from citation_verifier import CitationVerificationResult, FAKE, IRRELEVANT
+from fact_verifier import (
+    FactVerificationResult, SUPPORTED, CONTRADICTED, WEAK, NO_EVIDENCE
+)
 from config import SCORE_WEIGHTS, RISK_THRESHOLDS
 
+# Matches the interned style tag the extractor puts on URL citations, so
+# the broken-link check is a pointer compare rather than a string compare
+_URL = sys.intern("url")
 
-@dataclass
+
+def _risk_score_core(unv, fake, broken, contra, total, w_unv, w_fake, w_broken):
+    """Pure-numeric risk score kernel (caller guarantees total > 0)"""
+    score = (
+        unv * w_unv + fake * w_fake + broken * w_broken + contra * 0.3
+    ) * (100.0 / total)
+    # Inline clamp: one compare instead of a min() call per document
+    return 100.0 if score > 100.0 else score
+
+
+try:
+    # Optional: compile the kernel for batch-evaluation workloads that
+    # score thousands of documents in a loop
+    from numba import njit
+    _risk_score_core = njit(cache=True, fastmath=True)(_risk_score_core)
+except Exception:
+    pass
+
+
+# status -> (type, severity, detail template, recommendation); issue
+# emission becomes a table lookup, one format call and a positional
+# constructor instead of repeated kwargs blocks
+_CIT_SPEC = {
+    FAKE: (
+        "fake_citation", "high",
+        "Citation '{t}' not found in any academic database",
+        "Verify the citation manually or remove it if unverifiable"
+    ),
+    IRRELEVANT: (
+        "irrelevant_citation", "medium",
+        "Citation '{t}' exists but is not relevant to the claim",
+        "Find a more relevant citation or remove this one"
+    ),
+}
+
+_BROKEN_SPEC = (
+    "broken_link", "medium",
+    "URL '{t}' is not accessible (404 or connection error)",
+    "Update the URL or remove the broken link"
+)
+
+_FACT_SPEC = {
+    CONTRADICTED: (
+        "contradicted_claim", "high",
+        "Claim '{t}...' contradicts available evidence",
+        "Review the claim and verify against reliable sources"
+    ),
+    NO_EVIDENCE: (
+        "unverified_claim", "medium",
+        "Claim '{t}...' has no supporting evidence found",
+        "Provide citations or verify the claim independently"
+    ),
+    WEAK: (
+        "weak_evidence", "low",
+        "Claim '{t}...' has weak supporting evidence",
+        "Strengthen the claim with more reliable sources"
+    ),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     """Represents a detected issue"""
     type: str  # 'fake_citation', 'unverified_claim', 'contradicted_claim', 'broken_link'
     severity: str  # 'high', 'medium', 'low'
     detail: str
-    location: Dict  # start_pos, end_pos
+    location: Tuple[int, int]  # (start_pos, end_pos)
     recommendation: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HallucinationReport:
     """Complete hallucination detection report"""
     overall_risk: str  # 'low', 'medium', 'high'
@@ -36,12 +104,45 @@ class HallucinationReport:
     detailed_results: Dict
 
 
+# Shared report for the "nothing detected" case; the report is frozen,
+# so handing out one instance is safe and skips the whole scoring pass
+_EMPTY_REPORT = HallucinationReport(
+    overall_risk="low",
+    risk_score=0.0,
+    total_claims=0,
+    total_citations=0,
+    verified_claims=0,
+    fake_citations=0,
+    unverified_claims=0,
+    contradicted_claims=0,
+    broken_links=0,
+    issues=[],
+    detailed_results={
+        "citation_verifications": {
+            "citation": [], "status": [], "exists": [],
+            "accessible": [], "relevance": []
+        },
+        "fact_verifications": {
+            "claim": [], "status": [], "supported": [],
+            "contradicted": [], "evidence_score": []
+        }
+    }
+)
+
+
 class HallucinationScorer:
     """Computes hallucination risk scores and generates reports"""
     
     def __init__(self):
         self.weights = SCORE_WEIGHTS
         self.thresholds = RISK_THRESHOLDS
+        # Config is fixed for the scorer's lifetime; bind the values as
+        # plain floats so scoring skips the dict lookups per report
+        self._w_unverified = float(SCORE_WEIGHTS["unverified_claims"])
+        self._w_fake = float(SCORE_WEIGHTS["fake_citations"])
+        self._w_broken = float(SCORE_WEIGHTS["broken_links"])
+        self._t_low = RISK_THRESHOLDS["low"]
+        self._t_medium = RISK_THRESHOLDS["medium"]
     
     def generate_report(
         self,
@@ -52,33 +153,25 @@ class HallucinationScorer:
         claim_citation_pairs: List
     ) -> HallucinationReport:
         """Generate comprehensive hallucination report"""
-        
-        # Count issues
-        fake_citations = sum(
-            1 for r in citation_results 
-            if r.verification_status == "fake"
-        )
-        
-        broken_links = sum(
-            1 for r in citation_results 
-            if r.citation.citation_type == "url" and not r.accessible
-        )
-        
-        unverified_claims = sum(
-            1 for r in fact_results 
-            if r.verification_status in ["no_evidence", "weak"]
-        )
-        
-        contradicted_claims = sum(
-            1 for r in fact_results 
-            if r.contradiction
-        )
-        
-        verified_claims = sum(
-            1 for r in fact_results 
-            if r.verification_status == "supported"
+
+        # Fast path: short responses often contain nothing to score
+        if not claims and not citations and not citation_results and not fact_results:
+            return _EMPTY_REPORT
+
+        # Verification work is already deduplicated upstream (the batch
+        # verifiers resolve each unique citation/claim once and fan the
+        # result back out per occurrence); every occurrence must still
+        # be counted and get its own positioned issue here
+
+        # One pass per result list collects the counts and the issues
+        # together, touching each result object once
+        fake_citations, broken_links, citation_issues, citation_details = (
+            self._scan_citation_results(citation_results)
         )
-        
+        (verified_claims, unverified_claims, contradicted_claims,
+         fact_issues, fact_details) = self._scan_fact_results(fact_results)
+        issues = citation_issues + fact_issues
+
         # Calculate risk score
         risk_score = self._calculate_risk_score(
             unverified_claims=unverified_claims,
@@ -89,42 +182,19 @@ class HallucinationScorer:
         )
         
         # Determine overall risk level
-        if risk_score <= self.thresholds["low"]:
+        if risk_score <= self._t_low:
             overall_risk = "low"
-        elif risk_score <= self.thresholds["medium"]:
+        elif risk_score <= self._t_medium:
             overall_risk = "medium"
         else:
             overall_risk = "high"
         
-        # Generate issues list
-        issues = self._generate_issues(
-            claims, citations, citation_results, fact_results
-        )
-        
-        # Prepare detailed results
+        # Detailed rows come out of the same scans as the counts
         detailed_results = {
-            "citation_verifications": [
-                {
-                    "citation": r.citation.text,
-                    "status": r.verification_status,
-                    "exists": r.exists,
-                    "accessible": r.accessible,
-                    "relevance": r.relevance_score
-                }
-                for r in citation_results
-            ],
-            "fact_verifications": [
-                {
-                    "claim": r.claim.text,
-                    "status": r.verification_status,
-                    "supported": r.supported,
-                    "contradicted": r.contradiction,
-                    "evidence_score": r.evidence_score
-                }
-                for r in fact_results
-            ]
+            "citation_verifications": citation_details,
+            "fact_verifications": fact_details
         }
-        
+
         return HallucinationReport(
             overall_risk=overall_risk,
             risk_score=risk_score,
@@ -151,107 +221,164 @@ class HallucinationScorer:
         
         if total_claims == 0:
             return 0.0
-        
-        # Normalize counts to percentages
-        unverified_ratio = (unverified_claims / total_claims) * 100
-        fake_citation_ratio = (fake_citations / total_claims) * 100 if total_claims > 0 else 0
-        broken_link_ratio = (broken_links / total_claims) * 100 if total_claims > 0 else 0
-        contradicted_ratio = (contradicted_claims / total_claims) * 100
-        
-        # Weighted combination
-        score = (
-            unverified_ratio * self.weights["unverified_claims"] +
-            fake_citation_ratio * self.weights["fake_citations"] +
-            broken_link_ratio * self.weights["broken_links"] +
-            contradicted_ratio * 0.3  # Contradictions are very serious
-        )
-        
-        # Cap at 100
-        return min(100.0, score)
+
+        return float(_risk_score_core(
+            unverified_claims,
+            fake_citations,
+            broken_links,
+            contradicted_claims,
+            total_claims,
+            self._w_unverified,
+            self._w_fake,
+            self._w_broken
+        ))
     
-    def _generate_issues(
+    def score_batch(
         self,
-        claims: List[Claim],
-        citations: List[Citation],
-        citation_results: List[CitationVerificationResult],
-        fact_results: List[FactVerificationResult]
-    ) -> List[Issue]:
-        """Generate list of specific issues"""
+        unverified_claims,
+        fake_citations,
+        broken_links,
+        contradicted_claims,
+        total_claims
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score many documents in one vectorized sweep
+
+        Takes array-likes of per-document counts and returns
+        (risk_scores, risk_levels) arrays matching what
+        _calculate_risk_score and the report banding would produce
+        document by document.
+        """
+        unverified = np.asarray(unverified_claims, dtype=np.float64)
+        fake = np.asarray(fake_citations, dtype=np.float64)
+        broken = np.asarray(broken_links, dtype=np.float64)
+        contradicted = np.asarray(contradicted_claims, dtype=np.float64)
+        totals = np.asarray(total_claims, dtype=np.float64)
+
+        # Documents with no claims score 0, same as the scalar path
+        inv = np.divide(
+            100.0, totals,
+            out=np.zeros_like(totals),
+            where=totals > 0
+        )
+        scores = (
+            unverified * self._w_unverified +
+            fake * self._w_fake +
+            broken * self._w_broken +
+            contradicted * 0.3
+        ) * inv
+        # Clamp in place; no extra temporary for the capped array
+        np.minimum(scores, 100.0, out=scores)
+        levels = np.select(
+            [scores <= self._t_low, scores <= self._t_medium],
+            ["low", "medium"],
+            default="high"
+        )
+        return scores, levels
+
+    def _scan_citation_results(
+        self,
+        citation_results: List[CitationVerificationResult]
+    ) -> tuple:
+        """Count citation problems, issues and detail rows in one pass"""
+        counts = Counter()
         issues = []
-        
-        # Citation issues
+        # Column-oriented detail rows: five flat lists instead of one
+        # dict allocation per result
+        det_citation = []
+        det_status = []
+        det_exists = []
+        det_accessible = []
+        det_relevance = []
+
         for result in citation_results:
-            if result.verification_status == "fake":
-                issues.append(Issue(
-                    type="fake_citation",
-                    severity="high",
-                    detail=f"Citation '{result.citation.text}' not found in any academic database",
-                    location={
-                        "start": result.citation.start_pos or 0,
-                        "end": result.citation.end_pos or 0
-                    },
-                    recommendation="Verify the citation manually or remove it if unverifiable"
-                ))
-            elif result.verification_status == "irrelevant":
-                issues.append(Issue(
-                    type="irrelevant_citation",
-                    severity="medium",
-                    detail=f"Citation '{result.citation.text}' exists but is not relevant to the claim",
-                    location={
-                        "start": result.citation.start_pos or 0,
-                        "end": result.citation.end_pos or 0
-                    },
-                    recommendation="Find a more relevant citation or remove this one"
-                ))
-            elif result.citation.citation_type == "url" and not result.accessible:
+            det_citation.append(result.citation.text)
+            det_status.append(result.verification_status)
+            det_exists.append(result.exists)
+            det_accessible.append(result.accessible)
+            det_relevance.append(result.relevance_score)
+            counts[result.verification_status] += 1
+            is_broken = (
+                result.citation.citation_type is _URL and not result.accessible
+            )
+            if is_broken:
+                counts["url_broken"] += 1
+
+            spec = _CIT_SPEC.get(result.verification_status)
+            subject = result.citation.text
+            if spec is None and is_broken:
+                spec = _BROKEN_SPEC
+                subject = result.citation.url
+            if spec is not None:
                 issues.append(Issue(
-                    type="broken_link",
-                    severity="medium",
-                    detail=f"URL '{result.citation.url}' is not accessible (404 or connection error)",
-                    location={
-                        "start": result.citation.start_pos or 0,
-                        "end": result.citation.end_pos or 0
-                    },
-                    recommendation="Update the URL or remove the broken link"
+                    spec[0],
+                    spec[1],
+                    spec[2].format(t=subject),
+                    (result.citation.start_pos or 0,
+                     result.citation.end_pos or 0),
+                    spec[3]
                 ))
-        
-        # Fact verification issues
+
+        details = {
+            "citation": det_citation,
+            "status": det_status,
+            "exists": det_exists,
+            "accessible": det_accessible,
+            "relevance": det_relevance
+        }
+        return counts.get(FAKE, 0), counts.get("url_broken", 0), issues, details
+
+    def _scan_fact_results(
+        self,
+        fact_results: List[FactVerificationResult]
+    ) -> tuple:
+        """Count claim verdicts, issues and detail rows in one pass"""
+        counts = Counter()
+        issues = []
+        # Tracked separately: a contradicted result also carries
+        # status "contradicted", so tallying the flag into the same
+        # Counter would count it twice
+        contradicted_claims = 0
+        det_claim = []
+        det_status = []
+        det_supported = []
+        det_contradicted = []
+        det_evidence_score = []
+
         for result in fact_results:
+            status = result.verification_status
+            det_claim.append(result.claim.text)
+            det_status.append(status)
+            det_supported.append(result.supported)
+            det_contradicted.append(result.contradiction)
+            det_evidence_score.append(result.evidence_score)
+            counts[status] += 1
             if result.contradiction:
+                contradicted_claims += 1
+                spec = _FACT_SPEC[CONTRADICTED]
+            else:
+                spec = _FACT_SPEC.get(status)
+            if spec is not None:
+                # One truncation per claim, shared by all three issue kinds
+                preview = result.claim.text[:100]
                 issues.append(Issue(
-                    type="contradicted_claim",
-                    severity="high",
-                    detail=f"Claim '{result.claim.text[:100]}...' contradicts available evidence",
-                    location={
-                        "start": result.claim.start_pos,
-                        "end": result.claim.end_pos
-                    },
-                    recommendation="Review the claim and verify against reliable sources"
-                ))
-            elif result.verification_status == "no_evidence":
-                issues.append(Issue(
-                    type="unverified_claim",
-                    severity="medium",
-                    detail=f"Claim '{result.claim.text[:100]}...' has no supporting evidence found",
-                    location={
-                        "start": result.claim.start_pos,
-                        "end": result.claim.end_pos
-                    },
-                    recommendation="Provide citations or verify the claim independently"
-                ))
-            elif result.verification_status == "weak":
-                issues.append(Issue(
-                    type="weak_evidence",
-                    severity="low",
-                    detail=f"Claim '{result.claim.text[:100]}...' has weak supporting evidence",
-                    location={
-                        "start": result.claim.start_pos,
-                        "end": result.claim.end_pos
-                    },
-                    recommendation="Strengthen the claim with more reliable sources"
+                    spec[0],
+                    spec[1],
+                    spec[2].format(t=preview),
+                    (result.claim.start_pos, result.claim.end_pos),
+                    spec[3]
                 ))
-        
-        return issues
+
+        details = {
+            "claim": det_claim,
+            "status": det_status,
+            "supported": det_supported,
+            "contradicted": det_contradicted,
+            "evidence_score": det_evidence_score
+        }
+        verified_claims = counts.get(SUPPORTED, 0)
+        unverified_claims = counts.get(NO_EVIDENCE, 0) + counts.get(WEAK, 0)
+        return (verified_claims, unverified_claims, contradicted_claims,
+                issues, details)
 
 
 
@@ -1,6 +1,7 @@
 """
 Setup script to download required NLTK data and verify installation
 """
+import importlib.util
 import nltk
 import sys
 
@@ -8,25 +9,60 @@ def download_nltk_data():
     """Download required NLTK data"""
     print("📦 Downloading NLTK data...")
     
-    data_packages = [
-        'punkt',
-        'averaged_perceptron_tagger',
-        'maxent_ne_chunker',
-        'words'
-    ]
-    
-    for package in data_packages:
+    # Each package lives under its own data subdir; probing the wrong
+    # one raises LookupError and forces a needless re-download
+    data_packages = {
+        'punkt': 'tokenizers',
+        'averaged_perceptron_tagger': 'taggers',
+        'maxent_ne_chunker': 'chunkers',
+        'words': 'corpora'
+    }
+
+    missing = []
+    for package, subdir in data_packages.items():
         try:
             print(f"   Checking {package}...", end=" ")
-            nltk.data.find(f'tokenizers/{package}')
+            nltk.data.find(f'{subdir}/{package}')
             print("✓ Already downloaded")
         except LookupError:
-            print(f"   Downloading {package}...", end=" ")
-            nltk.download(package, quiet=True)
-            print("✓ Downloaded")
+            print("needs download")
+            missing.append(package)
         except Exception as e:
             print(f"   Error: {e}")
 
+    if missing:
+        # One download call fetches the package index once instead of
+        # once per package
+        print(f"   Downloading {', '.join(missing)}...", end=" ")
+        nltk.download(missing, quiet=True)
+        print("✓ Downloaded")
+
+def download_spacy_model():
+    """Download the spaCy English model used by the fast extraction path
+
+    Without it spacy.load fails at runtime and extraction silently
+    falls back to the slower NLTK pipeline.
+    """
+    print("\n📦 Checking spaCy model...")
+
+    if importlib.util.find_spec('spacy') is None:
+        print("   ✗ spacy not installed, skipping model download")
+        return
+
+    try:
+        print("   Checking en_core_web_sm...", end=" ")
+        if importlib.util.find_spec('en_core_web_sm') is not None:
+            print("✓ Already downloaded")
+            return
+        print("needs download")
+        print("   Downloading en_core_web_sm...", end=" ")
+        import spacy.cli
+        spacy.cli.download('en_core_web_sm')
+        print("✓ Downloaded")
+    except Exception as e:
+        print(f"   Error: {e}")
+        print("   Run manually: python -m spacy download en_core_web_sm")
+
 def verify_installation():
     """Verify that required packages are installed"""
     print("\n🔍 Verifying installation...")
@@ -39,19 +75,16 @@ def verify_installation():
         'transformers',
         'nltk',
         'torch',
-        'numpy',
-        'sklearn'
+        'numpy'
     ]
-    
+
     missing = []
     for package in required_packages:
-        try:
-            if package == 'sklearn':
-                __import__('sklearn')
-            else:
-                __import__(package)
+        # find_spec only checks presence; importing torch/transformers
+        # here would pay seconds of CUDA/registry initialization
+        if importlib.util.find_spec(package) is not None:
             print(f"   ✓ {package}")
-        except ImportError:
+        else:
             print(f"   ✗ {package} (missing)")
             missing.append(package)
     
@@ -68,6 +101,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     download_nltk_data()
+    download_spacy_model()
     success = verify_installation()
     
     print("\n" + "=" * 60)